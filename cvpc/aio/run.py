@@ -1,25 +1,41 @@
 # -*- coding: utf-8 -*-
 
-from asyncio import run as asyncio_run
-from sys import version_info
+from asyncio import AbstractEventLoop, Runner
+from functools import lru_cache
+from sys import platform
+from typing import Callable, Optional
 
+LoopFactory = Callable[[], AbstractEventLoop]
 
-def uv_run(coro) -> None:
-    from uvloop import install as uvloop_install
-    from uvloop import new_event_loop as uvloop_new_event_loop
 
-    if version_info >= (3, 11):
-        from asyncio import Runner  # type: ignore[attr-defined]
+@lru_cache
+def uvloop_factory() -> Optional[LoopFactory]:
+    # [IMPORTANT] Resolved once per process; the global loop policy is never touched
+    if platform == "win32":
+        return None
+
+    try:
+        from uvloop import new_event_loop
+    except ModuleNotFoundError:
+        return None
+
+    return new_event_loop
+
+
+def uvloop_available() -> bool:
+    return uvloop_factory() is not None
+
+
+def uv_run(coro) -> None:
+    loop_factory = uvloop_factory()
+    if loop_factory is None:
+        raise ModuleNotFoundError("uvloop is not available on this platform")
 
-        with Runner(loop_factory=uvloop_new_event_loop) as runner:
-            runner.run(coro)
-    else:
-        uvloop_install()
-        asyncio_run(coro)
+    with Runner(loop_factory=loop_factory) as runner:
+        runner.run(coro)
 
 
-def aio_run(coro, use_uvloop=False) -> None:
-    if use_uvloop:
-        uv_run(coro)
-    else:
-        asyncio_run(coro)
+def aio_run(coro, use_uvloop=True) -> None:
+    loop_factory = uvloop_factory() if use_uvloop else None
+    with Runner(loop_factory=loop_factory) as runner:
+        runner.run(coro)
@@ -2,28 +2,47 @@
 
 from argparse import Namespace
 from asyncio.exceptions import CancelledError
-from functools import lru_cache
-from typing import Callable, Dict
+from bisect import bisect_left
+from importlib import import_module
+from typing import Callable, Final, Optional, Tuple
 
-from cvpc.apps.agent import agent_main
-from cvpc.apps.cli import cli_main
-from cvpc.apps.server import server_main
 from cvpc.arguments import CMD_AGENT, CMD_CLI, CMD_SERVER
 from cvpc.logging.logging import logger
 
+AppType = Callable[[Namespace], None]
 
-@lru_cache
-def cmd_apps() -> Dict[str, Callable[[Namespace], None]]:
-    return {
-        CMD_AGENT: agent_main,
-        CMD_SERVER: server_main,
-        CMD_CLI: cli_main,
-    }
+
+def lazy_app(module: str, name: str) -> AppType:
+    # [IMPORTANT] Import the app module only when the subcommand actually runs
+    def _app(args: Namespace) -> None:
+        getattr(import_module(module), name)(args)
+
+    return _app
+
+
+# Sorted by command name so that 'find_app' can bisect it
+CMD_TABLE: Final[Tuple[Tuple[str, AppType], ...]] = tuple(
+    sorted(
+        (
+            (CMD_AGENT, lazy_app("cvpc.apps.agent", "agent_main")),
+            (CMD_SERVER, lazy_app("cvpc.apps.server", "server_main")),
+            (CMD_CLI, lazy_app("cvpc.apps.cli", "cli_main")),
+        ),
+        key=lambda x: x[0],
+    )
+)
+CMD_TABLE_NAMES: Final[Tuple[str, ...]] = tuple(name for name, _ in CMD_TABLE)
+
+
+def find_app(cmd: str) -> Optional[AppType]:
+    index = bisect_left(CMD_TABLE_NAMES, cmd)
+    if index < len(CMD_TABLE_NAMES) and CMD_TABLE_NAMES[index] == cmd:
+        return CMD_TABLE[index][1]
+    return None
 
 
 def run_app(cmd: str, args: Namespace) -> int:
-    apps = cmd_apps()
-    app = apps.get(cmd, None)
+    app = find_app(cmd)
     if app is None:
         logger.error(f"Unknown app command: {cmd}")
         return 1
@@ -1,10 +1,26 @@
 # -*- coding: utf-8 -*-
 
 from argparse import Namespace
+from typing import Final
 
 from cvpc.aio.run import aio_run
+from cvpc.arguments import (
+    API_HTTP_ARGUMENT_TYPES,
+    GLOBAL_ARGUMENT_TYPES,
+    OPTS_ARGUMENT_TYPES,
+    WS_ARGUMENT_TYPES,
+    ArgumentTypes,
+    assert_argument_types,
+)
 from cvpc.logging.logging import logger
 
+AGENT_ARGUMENT_TYPES: Final[ArgumentTypes] = (
+    API_HTTP_ARGUMENT_TYPES
+    + WS_ARGUMENT_TYPES
+    + OPTS_ARGUMENT_TYPES
+    + GLOBAL_ARGUMENT_TYPES
+)
+
 
 async def _agent_main_async(args: Namespace) -> None:
     from cvpc.apps.agent.handlers import EventHandlerRegistry
@@ -38,39 +54,23 @@ async def _agent_main_async(args: Namespace) -> None:
         await client.connect()
         logger.info("Agent connected successfully")
 
-        # Keep the agent running
-        await client._connected_event.wait()
+        # Keep the agent running until the connection is closed
+        await client.run()
 
     except KeyboardInterrupt:
         logger.info("Shutting down agent")
     except Exception as e:
         logger.error(f"Agent error: {e}")
     finally:
-        await client.disconnect()
+        # 'run' already cleans up once the connection is closed
+        if client.connected:
+            await client.disconnect()
         logger.info("Agent disconnected")
 
 
 def agent_main(args: Namespace) -> None:
-    assert isinstance(args.api_http_bind, str)
-    assert isinstance(args.api_http_port, int)
-    assert isinstance(args.api_http_timeout, float)
-    assert isinstance(args.ws_url, str)
-    assert isinstance(args.ws_connect_timeout, float)
-    assert isinstance(args.ws_ping_interval, float)
-    assert isinstance(args.ws_ping_timeout, float)
-    assert isinstance(args.opts, list)
-
-    assert isinstance(args.colored_logging, bool)
-    assert isinstance(args.default_logging, bool)
-    assert isinstance(args.simple_logging, bool)
-    assert isinstance(args.rotate_logging_prefix, str)
-    assert isinstance(args.rotate_logging_when, str)
-
-    assert isinstance(args.use_uvloop, bool)
-    assert isinstance(args.severity, str)
-    assert isinstance(args.debug, bool)
-    assert isinstance(args.verbose, int)
-    assert isinstance(args.D, bool)
+    if __debug__:
+        assert_argument_types(args, AGENT_ARGUMENT_TYPES)
 
     use_uvloop = args.use_uvloop
     aio_run(_agent_main_async(args), use_uvloop=use_uvloop)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Dict, Protocol
+from bisect import bisect_left
+from typing import Any, Protocol, Tuple
 
 from cvpc.logging.logging import logger
 
@@ -24,14 +25,14 @@ class MessageEventHandler:
     """Handler for message events"""
 
     async def handle(self, event_data: Any) -> None:
-        logger.info(f"Received message: {event_data}")
+        logger.info("Received message: %s", event_data)
 
 
 class TaskEventHandler:
     """Handler for task events"""
 
     async def handle(self, event_data: Any) -> None:
-        logger.info(f"Received task event: {event_data}")
+        logger.info("Received task event: %s", event_data)
         # TODO: Implement task execution logic
 
 
@@ -39,11 +40,11 @@ class StatusEventHandler:
     """Handler for status events"""
 
     async def handle(self, event_data: Any) -> None:
-        logger.info(f"Status update: {event_data}")
+        logger.info("Status update: %s", event_data)
 
 
 class DefaultEventHandler:
-    """Default handler for unknown events"""
+    """Default handler for unknown events (not dispatched by the registry)"""
 
     async def handle(self, event_data: Any) -> None:
         logger.warning(f"Unknown event data: {event_data}")
@@ -53,8 +54,9 @@ class EventHandlerRegistry:
     """Registry for event handlers"""
 
     def __init__(self) -> None:
-        self._handlers: Dict[str, EventHandler] = {}
-        self._default_handler = DefaultEventHandler()
+        # Parallel tuples kept sorted by event type for binary search
+        self._keys: Tuple[str, ...] = tuple()
+        self._handlers: Tuple[EventHandler, ...] = tuple()
 
         # Register default handlers
         self.register("ping", PingEventHandler())
@@ -62,21 +64,43 @@ class EventHandlerRegistry:
         self.register("task", TaskEventHandler())
         self.register("status", StatusEventHandler())
 
+    def _bisect(self, event_type: str) -> Tuple[int, bool]:
+        """Return the insertion index of the event type and whether it exists"""
+        keys = self._keys
+        index = bisect_left(keys, event_type)
+        return index, index < len(keys) and keys[index] == event_type
+
     def register(self, event_type: str, handler: EventHandler) -> None:
         """Register an event handler"""
-        self._handlers[event_type] = handler
+        handlers = self._handlers
+        index, found = self._bisect(event_type)
+        if found:
+            self._handlers = handlers[:index] + (handler,) + handlers[index + 1 :]
+        else:
+            keys = self._keys
+            self._keys = keys[:index] + (event_type,) + keys[index:]
+            self._handlers = handlers[:index] + (handler,) + handlers[index:]
         logger.debug(f"Registered handler for event type: {event_type}")
 
     def unregister(self, event_type: str) -> None:
         """Unregister an event handler"""
-        if event_type in self._handlers:
-            del self._handlers[event_type]
+        index, found = self._bisect(event_type)
+        if found:
+            keys = self._keys
+            handlers = self._handlers
+            self._keys = keys[:index] + keys[index + 1 :]
+            self._handlers = handlers[:index] + handlers[index + 1 :]
             logger.debug(f"Unregistered handler for event type: {event_type}")
 
     async def handle_event(self, event_type: str, event_data: Any) -> None:
         """Handle an event using the appropriate handler"""
-        handler = self._handlers.get(event_type, self._default_handler)
+        keys = self._keys
         try:
-            await handler.handle(event_data)
+            index = bisect_left(keys, event_type)
+            if index < len(keys) and keys[index] == event_type:
+                await self._handlers[index].handle(event_data)
+            else:
+                # Unknown events are only logged; no handler call, no extra await
+                logger.warning("Unknown event: %s", event_type)
         except Exception as e:
             logger.exception(f"Error handling event {event_type}: {e}")
@@ -1,40 +1,57 @@
 # -*- coding: utf-8 -*-
 
 from argparse import Namespace
-
+from typing import Final, FrozenSet, Sequence
+
+from cvpc.aio.run import aio_run
+from cvpc.arguments import (
+    GLOBAL_ARGUMENT_TYPES,
+    OPTS_ARGUMENT_TYPES,
+    ArgumentTypes,
+    assert_argument_types,
+)
 from cvpc.logging.logging import logger
 
+PROMPT: Final[str] = "cvpc> "
 
-def cli_main(args: Namespace) -> None:
-    assert isinstance(args.opts, list)
+EXIT_COMMANDS: Final[FrozenSet[str]] = frozenset(("exit", "quit", "q"))
+COMMANDS: Final[Sequence[str]] = tuple(sorted(EXIT_COMMANDS))
 
-    assert isinstance(args.colored_logging, bool)
-    assert isinstance(args.default_logging, bool)
-    assert isinstance(args.simple_logging, bool)
-    assert isinstance(args.rotate_logging_prefix, str)
-    assert isinstance(args.rotate_logging_when, str)
+CLI_ARGUMENT_TYPES: Final[ArgumentTypes] = OPTS_ARGUMENT_TYPES + GLOBAL_ARGUMENT_TYPES
 
-    assert isinstance(args.use_uvloop, bool)
-    assert isinstance(args.severity, str)
-    assert isinstance(args.debug, bool)
-    assert isinstance(args.verbose, int)
-    assert isinstance(args.D, bool)
 
-    logger.info("Starting interactive CLI interface")
+async def _cli_main_async() -> None:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.completion import WordCompleter
+
+    # Build the session once; its completer and history live for the whole REPL
+    session: PromptSession[str] = PromptSession(
+        completer=WordCompleter(list(COMMANDS), ignore_case=True),
+    )
+
+    while True:
+        try:
+            user_input = await session.prompt_async(PROMPT)
+        except EOFError:
+            break
 
-    # TODO: Implement interactive CLI using prompt_toolkit or similar
-    logger.info("Interactive CLI implementation pending")
+        command = user_input.strip()
+        if command.lower() in EXIT_COMMANDS:
+            break
+        if command:
+            logger.info(f"Command: {command}")
+            # TODO: Parse and execute commands
+
+
+def cli_main(args: Namespace) -> None:
+    if __debug__:
+        assert_argument_types(args, CLI_ARGUMENT_TYPES)
+
+    logger.info("Starting interactive CLI interface")
 
     try:
-        while True:
-            try:
-                user_input = input("cvpc> ")
-                if user_input.lower() in ("exit", "quit", "q"):
-                    break
-                logger.info(f"Command: {user_input}")
-                # TODO: Parse and execute commands
-            except EOFError:
-                break
+        use_uvloop = args.use_uvloop
+        aio_run(_cli_main_async(), use_uvloop=use_uvloop)
     except KeyboardInterrupt:
         logger.info("CLI interrupted")
     finally:
@@ -1,11 +1,24 @@
 # -*- coding: utf-8 -*-
 
-import asyncio
 from argparse import Namespace
+from asyncio import Event, get_running_loop
+from signal import SIGINT, SIGTERM
+from typing import Final
 
 from cvpc.aio.run import aio_run
+from cvpc.arguments import (
+    API_HTTP_ARGUMENT_TYPES,
+    GLOBAL_ARGUMENT_TYPES,
+    OPTS_ARGUMENT_TYPES,
+    ArgumentTypes,
+    assert_argument_types,
+)
 from cvpc.logging.logging import logger
 
+SERVER_ARGUMENT_TYPES: Final[ArgumentTypes] = (
+    API_HTTP_ARGUMENT_TYPES + OPTS_ARGUMENT_TYPES + GLOBAL_ARGUMENT_TYPES
+)
+
 
 async def _server_main_async(args: Namespace) -> None:
     """Async main function for HTTP API server"""
@@ -19,35 +32,31 @@ async def _server_main_async(args: Namespace) -> None:
     # TODO: Implement HTTP API server using FastAPI or similar
     logger.info("HTTP API server implementation pending")
 
+    loop = get_running_loop()
+    stop_event = Event()
+    signals = list()
+    for signum in (SIGINT, SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop_event.set)
+            signals.append(signum)
+        except NotImplementedError:
+            pass  # e.g. Windows; the runner still cancels us on Ctrl+C
+
     try:
-        # Keep server running
-        while True:
-            await asyncio.sleep(1)
-    except KeyboardInterrupt:
+        # Keep server running until a stop signal arrives
+        await stop_event.wait()
         logger.info("Shutting down HTTP API server")
     except Exception as e:
         logger.error(f"Server error: {e}")
     finally:
+        for signum in signals:
+            loop.remove_signal_handler(signum)
         logger.info("HTTP API server stopped")
 
 
 def server_main(args: Namespace) -> None:
-    assert isinstance(args.api_http_bind, str)
-    assert isinstance(args.api_http_port, int)
-    assert isinstance(args.api_http_timeout, float)
-    assert isinstance(args.opts, list)
-
-    assert isinstance(args.colored_logging, bool)
-    assert isinstance(args.default_logging, bool)
-    assert isinstance(args.simple_logging, bool)
-    assert isinstance(args.rotate_logging_prefix, str)
-    assert isinstance(args.rotate_logging_when, str)
-
-    assert isinstance(args.use_uvloop, bool)
-    assert isinstance(args.severity, str)
-    assert isinstance(args.debug, bool)
-    assert isinstance(args.verbose, int)
-    assert isinstance(args.D, bool)
+    if __debug__:
+        assert_argument_types(args, SERVER_ARGUMENT_TYPES)
 
     use_uvloop = args.use_uvloop
     aio_run(_server_main_async(args), use_uvloop=use_uvloop)
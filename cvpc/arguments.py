@@ -4,7 +4,7 @@ from argparse import REMAINDER, ArgumentParser, Namespace, RawDescriptionHelpFor
 from functools import lru_cache
 from os import R_OK, access, getcwd
 from os.path import isfile, join
-from typing import Final, List, Optional, Sequence
+from typing import Final, List, Optional, Sequence, Tuple
 
 from cvpc.logging.logging import (
     DEFAULT_TIMED_ROTATING_WHEN,
@@ -12,6 +12,7 @@ from cvpc.logging.logging import (
     SEVERITY_NAME_INFO,
     TIMED_ROTATING_WHEN,
 )
+from cvpc.system.environ import clear_typed_environ_cache
 from cvpc.system.environ import get_typed_environ_value as get_eval
 
 PROG: Final[str] = "cvpc"
@@ -62,6 +63,33 @@ VERBOSE_LEVEL_0: Final[int] = 0
 VERBOSE_LEVEL_1: Final[int] = 1
 VERBOSE_LEVEL_2: Final[int] = 2
 
+ArgumentTypes = Tuple[Tuple[str, type], ...]
+
+GLOBAL_ARGUMENT_TYPES: Final[ArgumentTypes] = (
+    ("colored_logging", bool),
+    ("default_logging", bool),
+    ("simple_logging", bool),
+    ("rotate_logging_prefix", str),
+    ("rotate_logging_when", str),
+    ("use_uvloop", bool),
+    ("severity", str),
+    ("debug", bool),
+    ("verbose", int),
+    ("D", bool),
+)
+API_HTTP_ARGUMENT_TYPES: Final[ArgumentTypes] = (
+    ("api_http_bind", str),
+    ("api_http_port", int),
+    ("api_http_timeout", float),
+)
+WS_ARGUMENT_TYPES: Final[ArgumentTypes] = (
+    ("ws_url", str),
+    ("ws_connect_timeout", float),
+    ("ws_ping_interval", float),
+    ("ws_ping_timeout", float),
+)
+OPTS_ARGUMENT_TYPES: Final[ArgumentTypes] = (("opts", list),)
+
 
 @lru_cache
 def version() -> str:
@@ -71,6 +99,13 @@ def version() -> str:
     return __version__
 
 
+def assert_argument_types(args: Namespace, types: ArgumentTypes) -> None:
+    # [IMPORTANT] Call it under 'if __debug__:' so that '-O' drops the whole loop
+    for name, cls in types:
+        value = getattr(args, name)
+        assert isinstance(value, cls), f"'{name}' must be {cls.__name__}: {value!r}"
+
+
 def add_dotenv_arguments(parser: ArgumentParser) -> None:
     parser.add_argument(
         "--no-dotenv",
@@ -210,6 +245,7 @@ def add_agent_parser(subparsers) -> None:
     )
 
 
+@lru_cache(maxsize=1)
 def default_argument_parser() -> ArgumentParser:
     parser = ArgumentParser(
         prog=PROG,
@@ -255,11 +291,20 @@ def default_argument_parser() -> ArgumentParser:
         help=f"Rotate logging when (default: '{DEFAULT_TIMED_ROTATING_WHEN}')",
     )
 
-    parser.add_argument(
+    use_uvloop = get_eval("USE_UVLOOP", True)
+    uvloop_group = parser.add_mutually_exclusive_group()
+    uvloop_group.add_argument(
         "--use-uvloop",
         action="store_true",
-        default=get_eval("USE_UVLOOP", False),
-        help="Replace the event loop with uvloop",
+        default=use_uvloop,
+        help="Replace the event loop with uvloop (default)",
+    )
+    uvloop_group.add_argument(
+        "--no-uvloop",
+        action="store_false",
+        default=use_uvloop,
+        dest="use_uvloop",
+        help="Use the default asyncio event loop instead of uvloop",
     )
     parser.add_argument(
         "--severity",
@@ -327,6 +372,10 @@ def _load_dotenv(
         load_dotenv(args.dotenv_path)
     except ModuleNotFoundError:
         pass
+    else:
+        # Defaults read from the environment may have changed
+        clear_typed_environ_cache()
+        default_argument_parser.cache_clear()
 
 
 def _remove_dotenv_attrs(namespace: Namespace) -> Namespace:
@@ -6,8 +6,10 @@ from typing import Callable, List, Optional
 from cvpc.apps import run_app
 from cvpc.arguments import (
     CMDS,
+    GLOBAL_ARGUMENT_TYPES,
     PRINTER_ATTR_KEY,
     VERBOSE_LEVEL_2,
+    assert_argument_types,
     get_default_arguments,
 )
 from cvpc.logging.logging import (
@@ -35,16 +37,8 @@ def main(
         return 1
 
     assert args.cmd in CMDS
-    assert isinstance(args.colored_logging, bool)
-    assert isinstance(args.default_logging, bool)
-    assert isinstance(args.simple_logging, bool)
-    assert isinstance(args.rotate_logging_prefix, str)
-    assert isinstance(args.rotate_logging_when, str)
-    assert isinstance(args.use_uvloop, bool)
-    assert isinstance(args.severity, str)
-    assert isinstance(args.debug, bool)
-    assert isinstance(args.verbose, int)
-    assert isinstance(args.D, bool)
+    if __debug__:
+        assert_argument_types(args, GLOBAL_ARGUMENT_TYPES)
 
     if args.D:
         args.colored_logging = True
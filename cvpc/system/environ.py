@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from functools import lru_cache
 from os import environ
 from typing import Dict, Optional, TypeVar, Union, overload
 
@@ -8,6 +9,28 @@ from cvpc.types.string.to_boolean import string_to_boolean
 DefaultT = TypeVar("DefaultT", str, bool, int, float)
 
 
+# [IMPORTANT] 'typed=True' keeps keys such as ('X', False) and ('X', 0) apart
+@lru_cache(typed=True)
+def _cached_typed_environ_value(
+    key: str,
+    default: Optional[DefaultT] = None,
+) -> Optional[Union[str, bool, int, float]]:
+    if default is None:
+        return environ.get(key)
+
+    value = environ.get(key, str(default))
+    if isinstance(default, str):
+        return value
+    elif isinstance(default, bool):
+        return string_to_boolean(value)
+    elif isinstance(default, int):
+        return int(value)
+    elif isinstance(default, float):
+        return float(value)
+    else:
+        raise TypeError(f"Unsupported default type: {type(default).__name__}")
+
+
 # fmt: off
 @overload
 def get_typed_environ_value(key: str) -> Optional[str]: ...
@@ -26,30 +49,22 @@ def get_typed_environ_value(
     key: str,
     default: Optional[DefaultT] = None,
 ) -> Optional[Union[str, bool, int, float]]:
-    if default is None:
-        return environ.get(key)
-
-    value = environ.get(key, str(default))
-    if isinstance(default, str):
-        return value
-    elif isinstance(default, bool):
-        return string_to_boolean(value)
-    elif isinstance(default, int):
-        return int(value)
-    elif isinstance(default, float):
-        return float(value)
-    else:
-        raise TypeError(f"Unsupported default type: {type(default).__name__}")
+    return _cached_typed_environ_value(key, default)
 
 
 def environ_dict() -> Dict[str, str]:
     return {k: str(environ.get(k)) for k in environ if environ}
 
 
+def clear_typed_environ_cache() -> None:
+    _cached_typed_environ_value.cache_clear()
+
+
 def exchange_env(key: str, exchange: Optional[str]) -> Optional[str]:
     result = environ.get(key)
     if result is not None:
         environ.pop(key)
     if exchange is not None:
         environ[key] = exchange
+    clear_typed_environ_cache()
     return result
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 
 import asyncio
-from asyncio import Event, Queue, Task, create_task, sleep
-from typing import Any, Awaitable, Callable, Optional
-from weakref import WeakSet
+from asyncio import Event, TaskGroup
+from typing import Any, Awaitable, Callable, Dict, Final, Optional, Tuple
+from weakref import ReferenceType, ref
 
 import msgpack
 import websockets
@@ -12,6 +12,20 @@ from websockets.exceptions import ConnectionClosed, WebSocketException
 from cvpc.logging.logging import logger
 
 EventCallbackType = Callable[[str, Any], Awaitable[None]]
+EventCallbackRefType = ReferenceType[EventCallbackType]
+
+OPCODE_PING: Final[int] = 0x01
+OPCODE_STATUS: Final[int] = 0x02
+
+# Payload-less control events travel as a single opcode byte instead of msgpack.
+# A lone positive fixint is never a valid envelope, so both forms can coexist.
+FAST_EVENT_FRAMES: Final[Dict[str, bytes]] = {
+    "ping": bytes((OPCODE_PING,)),
+    "status": bytes((OPCODE_STATUS,)),
+}
+FAST_FRAME_EVENTS: Final[Dict[bytes, str]] = {
+    v: k for k, v in FAST_EVENT_FRAMES.items()
+}
 
 
 class WebSocketClient:
@@ -23,33 +37,56 @@ class WebSocketClient:
         connect_timeout: float = 10.0,
         ping_interval: float = 30.0,
         ping_timeout: float = 10.0,
+        fast_control_frames: bool = False,
     ) -> None:
         self._url = url
         self._connect_timeout = connect_timeout
         self._ping_interval = ping_interval
         self._ping_timeout = ping_timeout
+        self._fast_control_frames = fast_control_frames
 
         self._websocket: Optional[websockets.WebSocketClientProtocol] = None
-        self._receive_task: Optional[Task[None]] = None
-        self._send_queue: Queue[bytes] = Queue()
-        self._send_task: Optional[Task[None]] = None
         self._connected_event = Event()
         self._should_stop = Event()
 
-        self._event_callbacks: WeakSet[EventCallbackType] = WeakSet()
+        # Copy-on-write snapshot of weak references; replaced, never mutated
+        self._event_callbacks: Tuple[EventCallbackRefType, ...] = tuple()
+
+        self._packer = msgpack.Packer(use_bin_type=True)
+        self._unpacker = self._new_unpacker()
+        self._unpacker_fed = 0
+
+    @staticmethod
+    def _new_unpacker() -> msgpack.Unpacker:
+        return msgpack.Unpacker(raw=False, use_list=False)
+
+    def _reset_unpacker(self) -> None:
+        self._unpacker = self._new_unpacker()
+        self._unpacker_fed = 0
 
     @property
     def connected(self) -> bool:
         """Check if WebSocket is connected"""
         return self._websocket is not None and not self._websocket.closed
 
+    def _alive_event_callbacks(
+        self,
+        exclude: Optional[EventCallbackType] = None,
+    ) -> Tuple[EventCallbackRefType, ...]:
+        return tuple(
+            r
+            for r in self._event_callbacks
+            if (c := r()) is not None and c is not exclude
+        )
+
     def add_event_callback(self, callback: EventCallbackType) -> None:
         """Add event callback for incoming messages"""
-        self._event_callbacks.add(callback)
+        callbacks = self._alive_event_callbacks(exclude=callback)
+        self._event_callbacks = callbacks + (ref(callback),)
 
     def remove_event_callback(self, callback: EventCallbackType) -> None:
         """Remove event callback"""
-        self._event_callbacks.discard(callback)
+        self._event_callbacks = self._alive_event_callbacks(exclude=callback)
 
     async def connect(self) -> None:
         """Connect to WebSocket server"""
@@ -70,15 +107,25 @@ class WebSocketClient:
             self._connected_event.set()
             self._should_stop.clear()
 
-            # Start background tasks
-            self._receive_task = create_task(self._receive_loop())
-            self._send_task = create_task(self._send_loop())
-
         except Exception as e:
             logger.error(f"Failed to connect to WebSocket: {e}")
             await self._cleanup()
             raise
 
+    async def run(self) -> None:
+        """Receive messages until disconnected or the connection is closed"""
+        if not self.connected:
+            logger.error("Cannot run: WebSocket not connected")
+            return
+
+        try:
+            async with TaskGroup() as tg:
+                tg.create_task(self._receive_loop())
+                # 'disconnect' closes the socket, which ends the receive loop
+                await self._should_stop.wait()
+        finally:
+            await self._cleanup()
+
     async def disconnect(self) -> None:
         """Disconnect from WebSocket server"""
         if not self.connected:
@@ -94,120 +141,114 @@ class WebSocketClient:
         """Clean up resources"""
         self._connected_event.clear()
 
-        # Cancel tasks
-        if self._receive_task and not self._receive_task.done():
-            self._receive_task.cancel()
-            try:
-                await self._receive_task
-            except Exception:
-                pass
-            self._receive_task = None
-
-        if self._send_task and not self._send_task.done():
-            self._send_task.cancel()
-            try:
-                await self._send_task
-            except Exception:
-                pass
-            self._send_task = None
+        # Detach first so that concurrent cleanups close the socket only once
+        websocket = self._websocket
+        self._websocket = None
 
         # Close WebSocket
-        if self._websocket:
+        if websocket is not None:
             try:
-                await self._websocket.close()
+                await websocket.close()
             except Exception:
                 pass
-            self._websocket = None
-
-        # Clear send queue
-        while not self._send_queue.empty():
-            try:
-                self._send_queue.get_nowait()
-                self._send_queue.task_done()
-            except Exception:
-                break
 
     async def _receive_loop(self) -> None:
-        """Background task to receive messages"""
-        while not self._should_stop.is_set() and self.connected:
-            try:
-                if self._websocket is None:
-                    break
+        """Receive messages until the connection is closed"""
+        ws = self._websocket
+        if ws is None:
+            return
 
-                message = await self._websocket.recv()
+        handle = self._handle_binary_message
+
+        try:
+            # Iteration ends on a normal close and raises on an abnormal one
+            async for message in ws:
                 if isinstance(message, bytes):
-                    await self._handle_binary_message(message)
+                    await handle(message)
                 else:
-                    logger.warning(f"Received non-binary message: {type(message)}")
-
-            except ConnectionClosed:
-                logger.info("WebSocket connection closed")
-                break
-            except WebSocketException as e:
-                logger.error(f"WebSocket error: {e}")
-                break
-            except Exception as e:
-                logger.exception(f"Unexpected error in receive loop: {e}")
-                break
-
-        await self._cleanup()
+                    logger.warning("Received non-binary message: %s", type(message))
+            logger.info("WebSocket connection closed")
+        except ConnectionClosed:
+            logger.info("WebSocket connection closed")
+        except WebSocketException as e:
+            logger.error(f"WebSocket error: {e}")
+        except Exception as e:
+            logger.exception(f"Unexpected error in receive loop: {e}")
+        finally:
+            # Wake up 'run' when the server closed the connection
+            self._should_stop.set()
 
     async def _handle_binary_message(self, data: bytes) -> None:
         """Handle incoming binary message"""
+        if len(data) == 1:
+            fast_event_type = FAST_FRAME_EVENTS.get(data)
+            if fast_event_type is not None:
+                logger.debug("Received control event: %s", fast_event_type)
+                await self._dispatch_event(fast_event_type, None)
+                return
+
+        # Each frame must carry exactly one msgpack object
+        unpacker = self._unpacker
         try:
-            message = msgpack.unpackb(data, raw=False)
-            if isinstance(message, dict):
-                event_type = message.get("type", "unknown")
-                event_data = message.get("data", {})
-                logger.debug(f"Received event: {event_type}")
-                await self._dispatch_event(event_type, event_data)
-            else:
-                logger.warning(f"Invalid message format: {type(message)}")
+            unpacker.feed(data)
+            self._unpacker_fed += len(data)
+            message = unpacker.unpack()
+        except msgpack.OutOfData:
+            logger.warning("Incomplete msgpack data in binary message")
+            self._reset_unpacker()
+            return
         except Exception as e:
             logger.error(f"Failed to handle binary message: {e}")
+            self._reset_unpacker()
+            return
+
+        if unpacker.tell() != self._unpacker_fed:
+            # Drop the trailing bytes so the next frame starts clean
+            logger.warning("Extra data after msgpack object in binary message")
+            self._reset_unpacker()
+            return
+
+        if isinstance(message, dict):
+            event_type = message.get("type", "unknown")
+            event_data = message.get("data", {})
+            logger.debug("Received event: %s", event_type)
+            await self._dispatch_event(event_type, event_data)
+        else:
+            logger.warning("Invalid message format: %s", type(message))
 
     async def _dispatch_event(self, event_type: str, event_data: Any) -> None:
         """Dispatch event to all registered callbacks"""
-        for callback in list(self._event_callbacks):
+        for callback_ref in self._event_callbacks:
+            callback = callback_ref()
+            if callback is None:
+                continue
             try:
                 await callback(event_type, event_data)
             except Exception as e:
                 logger.exception(f"Error in event callback for {event_type}: {e}")
 
-    async def _send_loop(self) -> None:
-        """Background task to send messages"""
-        while not self._should_stop.is_set():
-            try:
-                # Wait for message with timeout
-                message = await self._send_queue.get()
-
-                if self._websocket and self.connected:
-                    await self._websocket.send(message)
-                    logger.debug(f"Sent message: {len(message)} bytes")
-                else:
-                    logger.warning("Cannot send message: WebSocket not connected")
-
-                self._send_queue.task_done()
-
-            except Exception as e:
-                logger.error(f"Error in send loop: {e}")
-                await sleep(0.1)  # Brief pause before retry
-
     async def send_event(
         self,
         event_type: str,
         event_data: Any = None,
     ) -> None:
         """Send event to server"""
-        if not self.connected:
+        # Read the socket once instead of going through the 'connected' property
+        websocket = self._websocket
+        if websocket is None or websocket.closed:
             logger.error("Cannot send event: WebSocket not connected")
             return
 
         try:
-            message = {"type": event_type, "data": event_data}
-            packed_message = msgpack.packb(message, use_bin_type=True)
-            await self._send_queue.put(packed_message)
-            logger.debug(f"Queued event: {event_type}")
+            packed_message: Optional[bytes] = None
+            if event_data is None and self._fast_control_frames:
+                packed_message = FAST_EVENT_FRAMES.get(event_type)
+            if packed_message is None:
+                message = {"type": event_type, "data": event_data}
+                packed_message = self._packer.pack(message)
+            # The protocol serializes concurrent writes; no queue is needed
+            await websocket.send(packed_message)
+            logger.debug("Sent event: %s (%d bytes)", event_type, len(packed_message))
         except Exception as e:
             logger.error(f"Failed to send event {event_type}: {e}")
 
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+from argparse import Namespace
+from unittest import TestCase, main
+
+from cvpc.apps import CMD_TABLE_NAMES, find_app, run_app
+from cvpc.arguments import CMDS
+
+
+class AppsTestCase(TestCase):
+    def test_cmd_table_names(self):
+        self.assertEqual(tuple(sorted(CMDS)), CMD_TABLE_NAMES)
+
+    def test_find_app(self):
+        for cmd in CMDS:
+            self.assertIsNotNone(find_app(cmd))
+        self.assertIsNone(find_app(""))
+        self.assertIsNone(find_app("unknown"))
+        self.assertIsNone(find_app("zzz"))
+
+    def test_run_unknown_app(self):
+        self.assertEqual(1, run_app("unknown", Namespace()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+from uuid import uuid4
+
+from cvpc.system.environ import exchange_env, get_typed_environ_value
+
+
+class EnvironTestCase(TestCase):
+    def setUp(self):
+        self.key = f"CVPC_TEST_{uuid4().hex.upper()}"
+
+    def tearDown(self):
+        exchange_env(self.key, None)
+
+    def test_typed_default(self):
+        exchange_env(self.key, "1")
+        self.assertIs(True, get_typed_environ_value(self.key, False))
+        self.assertEqual(1, get_typed_environ_value(self.key, 0))
+        self.assertEqual(1.0, get_typed_environ_value(self.key, 0.0))
+        self.assertEqual("1", get_typed_environ_value(self.key, ""))
+
+    def test_exchange_env_invalidates_cache(self):
+        self.assertEqual(10, get_typed_environ_value(self.key, 10))
+        exchange_env(self.key, "20")
+        self.assertEqual(20, get_typed_environ_value(self.key, 10))
+        exchange_env(self.key, None)
+        self.assertEqual(10, get_typed_environ_value(self.key, 10))
+
+
+if __name__ == "__main__":
+    main()
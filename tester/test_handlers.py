@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any, List
+from unittest import IsolatedAsyncioTestCase, main
+
+from cvpc.apps.agent.handlers import EventHandlerRegistry
+
+
+class _RecordEventHandler:
+    def __init__(self) -> None:
+        self.events: List[Any] = list()
+
+    async def handle(self, event_data: Any) -> None:
+        self.events.append(event_data)
+
+
+class EventHandlerRegistryTestCase(IsolatedAsyncioTestCase):
+    async def test_register_keeps_keys_sorted(self):
+        registry = EventHandlerRegistry()
+        registry.register("alpha", _RecordEventHandler())
+        registry.register("zulu", _RecordEventHandler())
+        self.assertEqual(tuple(sorted(registry._keys)), registry._keys)
+        self.assertEqual(len(registry._keys), len(registry._handlers))
+
+    async def test_handle_event(self):
+        registry = EventHandlerRegistry()
+        handler = _RecordEventHandler()
+        registry.register("custom", handler)
+        await registry.handle_event("custom", 1)
+        await registry.handle_event("unknown", 2)
+        self.assertEqual([1], handler.events)
+
+    async def test_handle_unknown_event(self):
+        registry = EventHandlerRegistry()
+        with self.assertLogs("cvpc", level="WARNING") as logs:
+            await registry.handle_event("unknown", 1)
+        self.assertIn("Unknown event: unknown", logs.output[0])
+
+    async def test_register_replaces_existing(self):
+        registry = EventHandlerRegistry()
+        first = _RecordEventHandler()
+        second = _RecordEventHandler()
+        registry.register("custom", first)
+        registry.register("custom", second)
+        await registry.handle_event("custom", 1)
+        self.assertEqual([], first.events)
+        self.assertEqual([1], second.events)
+
+    async def test_unregister(self):
+        registry = EventHandlerRegistry()
+        handler = _RecordEventHandler()
+        registry.register("custom", handler)
+        registry.unregister("custom")
+        registry.unregister("custom")
+        await registry.handle_event("custom", 1)
+        self.assertEqual([], handler.events)
+        self.assertNotIn("custom", registry._keys)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any, List, Tuple
+from unittest import IsolatedAsyncioTestCase, main
+
+import msgpack
+
+from cvpc.ws.client import FAST_EVENT_FRAMES, WebSocketClient
+
+
+class WebSocketClientTestCase(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.events: List[Tuple[str, Any]] = list()
+        self.client = WebSocketClient("ws://localhost")
+        # Callbacks are held weakly; keep the bound method alive
+        self.callback = self._on_event
+        self.client.add_event_callback(self.callback)
+
+    async def _on_event(self, event_type: str, event_data: Any) -> None:
+        self.events.append((event_type, event_data))
+
+    async def test_msgpack_envelope(self):
+        data = msgpack.packb({"type": "message", "data": [1, 2]})
+        await self.client._handle_binary_message(data)
+        self.assertEqual([("message", (1, 2))], self.events)
+
+    async def test_fast_control_frames(self):
+        for event_type, frame in FAST_EVENT_FRAMES.items():
+            await self.client._handle_binary_message(frame)
+        expected = [(event_type, None) for event_type in FAST_EVENT_FRAMES]
+        self.assertEqual(expected, self.events)
+
+    async def test_incomplete_frame_does_not_leak(self):
+        data = msgpack.packb({"type": "message", "data": None})
+        await self.client._handle_binary_message(data[:-1])
+        await self.client._handle_binary_message(data)
+        self.assertEqual([("message", None)], self.events)
+
+    async def test_trailing_partial_frame_does_not_leak(self):
+        first = msgpack.packb({"type": "a", "data": 1})
+        second = msgpack.packb({"type": "b", "data": 2})
+        await self.client._handle_binary_message(first + second[:-1])
+        await self.client._handle_binary_message(second)
+        self.assertEqual([("b", 2)], self.events)
+        self.assertEqual(self.client._unpacker_fed, self.client._unpacker.tell())
+
+    async def test_multiple_objects_in_frame(self):
+        first = msgpack.packb({"type": "a", "data": 1})
+        second = msgpack.packb({"type": "b", "data": 2})
+        await self.client._handle_binary_message(first + second)
+        await self.client._handle_binary_message(second)
+        self.assertEqual([("b", 2)], self.events)
+
+    async def test_remove_event_callback(self):
+        self.client.remove_event_callback(self.callback)
+        await self.client._handle_binary_message(FAST_EVENT_FRAMES["ping"])
+        self.assertEqual([], self.events)
+
+
+if __name__ == "__main__":
+    main()